@@ -34,15 +34,19 @@ class PomodoroController:
         # Timer reference
         self.timer_job = None
         
+        # History window, created on first use
+        self._history_win = None
+        
         # Sound notification flag
         self.notification_shown = False
+        self._beep = self._resolve_beep()
         
         # Initial view update
         self.update_view()
     
     def handle_start_stop(self):
         """Handle start/stop button press."""
-        current_state = self.model.session_state['state']
+        current_state = self.model.state
         
         if current_state == PomodoroModel.STATE_IDLE or current_state == PomodoroModel.STATE_PAUSED:
             # Start or resume the timer
@@ -56,7 +60,7 @@ class PomodoroController:
     
     def handle_pause(self):
         """Handle pause button press."""
-        current_state = self.model.session_state['state']
+        current_state = self.model.state
         
         if current_state == PomodoroModel.STATE_RUNNING:
             # Pause the timer
@@ -71,31 +75,17 @@ class PomodoroController:
     
     def handle_history(self):
         """Handle history button press."""
-        was_running = self.model.session_state['state'] == PomodoroModel.STATE_RUNNING
-        if was_running:
-            self.model.pause_timer()
-        self._stop_tick()
-    
-        statistics = self.model.statistics.copy()
-        HistoryWindow(self.root, statistics)
-    
-        if was_running:
-            self.model.start_timer()
-        self._start_tick()
-        
-    # Show history window
-        statistics = self.model.statistics.copy()
-        HistoryWindow(self.root, statistics)
-    
-    # Resume timer if it was running
-        if was_running:
-            self.model.start_timer()
-            self._start_tick()
+        # Build the history window once, then just refresh and re-show it
+        if self._history_win is None:
+            self._history_win = HistoryWindow(self.root, self.model.statistics)
+        else:
+            self._history_win.refresh(self.model.statistics)
+            self._history_win.show()
     
     def handle_settings(self):
         """Handle settings button press."""
         # Pause timer if running
-        was_running = self.model.session_state['state'] == PomodoroModel.STATE_RUNNING
+        was_running = self.model.state == PomodoroModel.STATE_RUNNING
         if was_running:
             self.model.pause_timer()
             self._stop_tick()
@@ -124,21 +114,21 @@ class PomodoroController:
             self.timer_job = None
     
     def _tick(self):
-        """Timer tick - called every second."""
+        """Timer tick - scheduled on each whole-second boundary."""
         session_complete = self.model.tick()
         
         if session_complete:
             self._handle_session_complete()
         
         # Schedule next tick if timer is still running
-        if self.model.session_state['state'] == PomodoroModel.STATE_RUNNING:
-            self.timer_job = self.root.after(1000, self._tick)
+        if self.model.state == PomodoroModel.STATE_RUNNING:
+            self.timer_job = self.root.after(self.model.ms_until_next_tick(), self._tick)
         else:
             self.timer_job = None
     
     def _handle_session_complete(self):
         """Handle completion of a session."""
-        session_type = self.model.session_state['session_type']
+        session_type = self.model.session_type
         
         # Show notification
         if not self.notification_shown:
@@ -156,32 +146,28 @@ class PomodoroController:
         
         # Play sound
         self._play_notification_sound()
-        
-        # Check if auto-start is enabled
-        if self.model.session_state['state'] == PomodoroModel.STATE_RUNNING:
-            # Auto-start is enabled, continue ticking
-            self._tick()
-        else:
-            # Stop ticking, wait for user to start
-            self._stop_tick()
+        # _tick schedules the next tick itself if auto-start kept the timer running
     
-    def _play_notification_sound(self):
-        """Play notification sound."""
+    def _resolve_beep(self):
+        """Pick the notification sound backend once."""
         try:
             # Try to use winsound on Windows
             import winsound
-            winsound.MessageBeep(winsound.MB_ICONASTERISK)
-        except (ImportError, RuntimeError):
+            return lambda: winsound.MessageBeep(winsound.MB_ICONASTERISK)
+        except ImportError:
             # Fallback to system bell
-            try:
-                self.root.bell()
-            except:
-                pass
+            return self.root.bell
+    
+    def _play_notification_sound(self):
+        """Play notification sound."""
+        try:
+            self._beep()
+        except (RuntimeError, tk.TclError):
+            pass
 
     def update_view(self):
         """Update view with current model state."""
-        state = self.model.get_state_dict()
-        self.view.update_display(state)
+        self.view.update_display(self.model.get_session_view())
     
     def run(self):
         """Start the application main loop."""
@@ -191,4 +177,4 @@ class PomodoroController:
         """Cleanup before closing."""
         self._stop_tick()
         # Save any pending statistics
-        self.model._save_statistics()
\ No newline at end of file
+        self.model.close()
\ No newline at end of file
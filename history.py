@@ -6,14 +6,46 @@ Shows all past sessions with dates and times
 import tkinter as tk
 from tkinter import ttk
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List
 
+
+@lru_cache(maxsize=1024)
+def _format_timestamp(timestamp: str):
+    """Split an ISO timestamp into display date and time strings."""
+    try:
+        dt = datetime.fromisoformat(timestamp)
+        return dt.strftime('%Y-%m-%d'), dt.strftime('%H:%M:%S')
+    except (TypeError, ValueError):
+        return 'Unknown', 'Unknown'
+
+
+# Shared widget options for the summary boxes
+_STAT_BOX_STYLE = {'bg': 'white', 'relief': tk.RIDGE, 'bd': 2, 'width': 150, 'height': 80}
+_STAT_LABEL_STYLE = {'font': ('Helvetica', 9), 'bg': 'white', 'fg': '#666'}
+_STAT_VALUE_STYLE = {'font': ('Helvetica', 20, 'bold'), 'bg': 'white'}
+
+
 class HistoryWindow:
     """Window to display session history."""
     
+    # Rows inserted per idle callback, so large histories don't block the UI
+    CHUNK_SIZE = 200
+    
+    # (column id, heading, width)
+    COLUMNS = (
+        ('Date', '📅 Date', 120),
+        ('Time', '🕐 Time', 100),
+        ('Type', '📋 Type', 100),
+        ('Name', '✏ Session Name', 250),
+        ('Duration', '⏱ Duration', 100),
+    )
+    
     def __init__(self, parent, statistics: Dict):
         """Initialize history window."""
         self.statistics = statistics
+        self._stat_labels = {}
+        self._load_generation = 0
         
         # Create window
         self.window = tk.Toplevel(parent)
@@ -25,9 +57,30 @@ class HistoryWindow:
         self.window.transient(parent)
         self.window.grab_set()
         
+        # Closing only hides the window so it can be reopened cheaply
+        self.window.protocol("WM_DELETE_WINDOW", self.hide)
+        
         self._create_widgets()
+        self._update_summary()
         self._load_history()
     
+    def refresh(self, statistics: Dict):
+        """Reload the window contents from the given statistics."""
+        self.statistics = statistics
+        self._update_summary()
+        self._load_history()
+    
+    def show(self):
+        """Show the hidden window again."""
+        self.window.deiconify()
+        self.window.lift()
+        self.window.grab_set()
+    
+    def hide(self):
+        """Hide the window without destroying it."""
+        self.window.grab_release()
+        self.window.withdraw()
+    
     def _create_widgets(self):
         """Create all widgets."""
         # Title frame
@@ -51,40 +104,13 @@ class HistoryWindow:
         stats_container = tk.Frame(summary_frame, bg='#F0F4F8')
         stats_container.pack(expand=True)
         
-        # Total sessions
-        self._create_stat_box(
-            stats_container, 
-            "Total Sessions", 
-            str(self.statistics['sessions_completed']),
-            '#4A90E2'
-        ).pack(side=tk.LEFT, padx=10)
-        
-        # Total work time
-        work_hours = self.statistics['total_work_time'] / 3600
-        self._create_stat_box(
-            stats_container,
-            "Work Time",
-            f"{work_hours:.1f}h",
-            '#27AE60'
-        ).pack(side=tk.LEFT, padx=10)
-        
-        # Total break time
-        break_hours = self.statistics['total_break_time'] / 3600
-        self._create_stat_box(
-            stats_container,
-            "Break Time",
-            f"{break_hours:.1f}h",
-            '#E67E22'
-        ).pack(side=tk.LEFT, padx=10)
-        
-        # Today's sessions
-        today_count = len(self.statistics['today_sessions'])
-        self._create_stat_box(
-            stats_container,
-            "Today's Sessions",
-            str(today_count),
-            '#9B59B6'
-        ).pack(side=tk.LEFT, padx=10)
+        for label, color in (
+            ("Total Sessions", '#4A90E2'),
+            ("Work Time", '#27AE60'),
+            ("Break Time", '#E67E22'),
+            ("Today's Sessions", '#9B59B6'),
+        ):
+            self._create_stat_box(stats_container, label, color).pack(side=tk.LEFT, padx=10)
         
         # Treeview frame
         tree_frame = tk.Frame(self.window)
@@ -100,7 +126,7 @@ class HistoryWindow:
         # Treeview
         self.tree = ttk.Treeview(
             tree_frame,
-            columns=('Date', 'Time', 'Type', 'Name', 'Duration'),
+            columns=[column for column, _, _ in self.COLUMNS],
             show='headings',
             yscrollcommand=vsb.set,
             xscrollcommand=hsb.set,
@@ -111,17 +137,9 @@ class HistoryWindow:
         hsb.config(command=self.tree.xview)
         
         # Define columns
-        self.tree.heading('Date', text='📅 Date')
-        self.tree.heading('Time', text='🕐 Time')
-        self.tree.heading('Type', text='📋 Type')
-        self.tree.heading('Name', text='✏ Session Name')
-        self.tree.heading('Duration', text='⏱ Duration')
-        
-        self.tree.column('Date', width=120)
-        self.tree.column('Time', width=100)
-        self.tree.column('Type', width=100)
-        self.tree.column('Name', width=250)
-        self.tree.column('Duration', width=100)
+        for column, heading, width in self.COLUMNS:
+            self.tree.heading(column, text=heading)
+            self.tree.column(column, width=width)
         
         self.tree.pack(fill=tk.BOTH, expand=True)
         
@@ -140,65 +158,71 @@ class HistoryWindow:
             padx=30,
             pady=10,
             cursor='hand2',
-            command=self.window.destroy
+            command=self.hide
         )
         close_btn.pack(pady=20)
     
-    def _create_stat_box(self, parent, label, value, color):
-        """Create a statistics box."""
-        box = tk.Frame(parent, bg='white', relief=tk.RIDGE, bd=2)
-        
-        tk.Label(
-            box,
-            text=label,
-            font=('Helvetica', 9),
-            bg='white',
-            fg='#666'
-        ).pack(pady=(10, 0))
+    def _create_stat_box(self, parent, label, color):
+        """Create a statistics box; its value is filled in by _update_summary."""
+        # Size is passed at construction, so no separate config() call is needed
+        box = tk.Frame(parent, **_STAT_BOX_STYLE)
+        box.pack_propagate(False)
         
-        tk.Label(
-            box,
-            text=value,
-            font=('Helvetica', 20, 'bold'),
-            bg='white',
-            fg=color
-        ).pack(pady=(0, 10))
+        tk.Label(box, text=label, **_STAT_LABEL_STYLE).pack(pady=(10, 0))
         
-        box.pack_propagate(False)
-        box.config(width=150, height=80)
+        self._stat_labels[label] = tk.Label(box, fg=color, **_STAT_VALUE_STYLE)
+        self._stat_labels[label].pack(pady=(0, 10))
         
         return box
     
+    def _update_summary(self):
+        """Fill the summary boxes from the statistics."""
+        work_hours = self.statistics['total_work_time'] / 3600
+        break_hours = self.statistics['total_break_time'] / 3600
+        values = {
+            "Total Sessions": str(self.statistics['sessions_completed']),
+            "Work Time": f"{work_hours:.1f}h",
+            "Break Time": f"{break_hours:.1f}h",
+            "Today's Sessions": str(len(self.statistics['today_sessions'])),
+        }
+        for label, value in values.items():
+            self._stat_labels[label].config(text=value)
+    
     def _load_history(self):
         """Load all sessions into treeview."""
         # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Get all sessions (reversed to show newest first)
-        sessions = self.statistics['today_sessions'][::-1]
-        
-        for session in sessions:
-            # Parse timestamp
-            try:
-                dt = datetime.fromisoformat(session['timestamp'])
-                date_str = dt.strftime('%Y-%m-%d')
-                time_str = dt.strftime('%H:%M:%S')
-            except:
-                date_str = 'Unknown'
-                time_str = 'Unknown'
-            
-            # Get session details
-            session_type = '💼 Work' if session['type'] == 'work' else '☕ Break'
-            session_name = session.get('name', 'Untitled')
-            duration = session['duration']
-            duration_str = f"{duration // 60}m {duration % 60}s"
-            
-            # Insert into treeview
-            tag = 'work' if session['type'] == 'work' else 'break'
-            self.tree.insert(
-                '',
-                tk.END,
-                values=(date_str, time_str, session_type, session_name, duration_str),
-                tags=(tag,)
-            )
\ No newline at end of file
+        self.tree.delete(*self.tree.get_children())
+        
+        # Format all rows up front (reversed to show newest first)
+        rows = [self._format_row(session)
+                for session in reversed(self.statistics['today_sessions'])]
+        
+        # A newer load supersedes chunks still pending from an older one
+        self._load_generation += 1
+        self._insert_chunk(rows, 0, self._load_generation)
+    
+    def _format_row(self, session: Dict):
+        """Return the treeview values and tag for one session."""
+        date_str, time_str = _format_timestamp(session.get('timestamp'))
+        
+        # Get session details
+        is_work = session['type'] == 'work'
+        session_type = '💼 Work' if is_work else '☕ Break'
+        session_name = session.get('name', 'Untitled')
+        duration = session['duration']
+        duration_str = f"{duration // 60}m {duration % 60}s"
+        
+        return (date_str, time_str, session_type, session_name, duration_str), ('work' if is_work else 'break',)
+    
+    def _insert_chunk(self, rows: List, start: int, generation: int):
+        """Insert one chunk of rows, then yield to the event loop."""
+        if generation != self._load_generation or not self.window.winfo_exists():
+            return
+        
+        insert = self.tree.insert
+        end = start + self.CHUNK_SIZE
+        for values, tags in rows[start:end]:
+            insert('', tk.END, values=values, tags=tags)
+        
+        if end < len(rows):
+            self.window.after_idle(self._insert_chunk, rows, end, generation)
@@ -5,9 +5,50 @@ Handles all business logic and data management
 
 import json
 import os
-from datetime import datetime
-from typing import Dict, List, Callable
+import queue
+import threading
+import time
+from collections import deque, namedtuple
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, Tuple, Callable
 
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    # Fall back to the stdlib encoder with the same compact bytes output
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+    _loads = json.loads
+
+
+_now = datetime.now
+
+# Flat snapshot of just what the main window displays
+SessionView = namedtuple(
+    'SessionView',
+    'state session_type current_time total_time current_cycle total_cycles '
+    'work_done break_done today_sessions'
+)
+
+# Statistics files: totals in a small meta file, sessions in an append-only log
+META_FILE = 'data/pomodoro_meta.json'
+SESSIONS_FILE = 'data/pomodoro_sessions.jsonl'
+LEGACY_STATS_FILE = 'data/pomodoro_stats.json'
+META_KEYS = ('total_work_time', 'total_break_time', 'sessions_completed', 'last_reset')
+
+# Most recent sessions kept in memory
+MAX_SESSIONS = 500
+
+
+@lru_cache(maxsize=4096)
+def _format_mmss(seconds: int) -> str:
+    """Format seconds as MM:SS (memoized, the same values repeat every session)."""
+    minutes, secs = divmod(seconds, 60)
+    return f"{minutes:02d}:{secs:02d}"
 
  
 class PomodoroModel:
@@ -28,6 +69,10 @@ class PomodoroModel:
     
     def __init__(self):
         """Initialize the Pomodoro model with default settings."""
+        # Cached date string, refreshed once the next midnight has passed
+        self._today_str = ''
+        self._next_midnight = 0.0
+        
         # Configuration dictionary
         self.config: Dict = {
             'work_duration': 25 * 60,  # 25 minutes in seconds
@@ -38,11 +83,17 @@ class PomodoroModel:
             'auto_start_work': False,
         }
         
+        # Hot session fields live on attributes; session_state mirrors them
+        # for observers via _sync_session_state
+        self._current_time = self.config['work_duration']
+        self._session_type = self.SESSION_WORK
+        self._state = self.STATE_IDLE
+        
         # Current session state
         self.session_state: Dict = {
-            'current_time': self.config['work_duration'],
-            'session_type': self.SESSION_WORK,
-            'state': self.STATE_IDLE,
+            'current_time': self._current_time,
+            'session_type': self._session_type,
+            'state': self._state,
             'current_cycle': 1,
             'total_cycles': self.config['cycles_before_long_break'],
             'completed_work_sessions': 0,
@@ -55,12 +106,33 @@ class PomodoroModel:
             'total_work_time': 0,  # in seconds
             'total_break_time': 0,
             'sessions_completed': 0,
-            'today_sessions': [],
-            'last_reset': datetime.now().strftime('%Y-%m-%d'),
+            'today_sessions': deque(maxlen=MAX_SESSIONS),
+            'last_reset': self._today(),
         }
         
+        # Session type to duration, rebuilt only when the config changes
+        self._build_durations()
+        
+        # Full length of the current session, kept in step with session_type
+        self._total_time = self.config['work_duration']
+        
+        # Monotonic anchor of the running countdown (see _start_clock)
+        self._t0 = 0.0
+        self._initial = self._current_time
+        
         # Observer pattern for notifications
         self.observers: List[Callable] = []
+        self._suspend_notify = 0
+        self._dirty = False
+        self._last_notified = None
+        
+        # Session log, opened in append mode by the saver thread
+        self._session_fp = None
+        
+        # Disk writes are queued and performed in order by a background thread
+        self._save_q = queue.Queue()
+        self._saver = threading.Thread(target=self._save_worker, daemon=True)
+        self._saver.start()
         
         self._load_statistics()
     
@@ -75,192 +147,354 @@ class PomodoroModel:
             self.observers.remove(callback)
     
     def notify_observers(self):
-        """Notify all observers of state changes."""
+        """Notify all observers of state changes, skipping unchanged state."""
         # print(self.observers)
+        self._sync_session_state()
+        key = (tuple(self.session_state.values()), tuple(self.config.values()),
+               len(self.statistics['today_sessions']))
+        if key == self._last_notified:
+            return
+        self._last_notified = key
         for callback in self.observers:
             callback()
     
+    def _changed(self):
+        """Flag a state change and notify observers unless inside a batch."""
+        self._dirty = True
+        self._maybe_notify()
+    
+    def _maybe_notify(self):
+        """Notify observers of pending changes once no batch is open."""
+        if self._dirty and not self._suspend_notify:
+            self._dirty = False
+            self.notify_observers()
+    
+    @contextmanager
+    def _batch(self):
+        """Collapse all changes made inside the block into one notification."""
+        self._suspend_notify += 1
+        try:
+            yield
+        finally:
+            self._suspend_notify -= 1
+            self._maybe_notify()
+    
     def start_timer(self):
         """Start the timer."""
         # print("start timer")
-        self.session_state['state'] = self.STATE_RUNNING
-        self.notify_observers()
+        self._state = self.STATE_RUNNING
+        self._start_clock()
+        self._changed()
     
     def stop_timer(self):
         """Stop the timer and reset current session."""
-        self.session_state['state'] = self.STATE_IDLE
+        self._state = self.STATE_IDLE
         self._reset_current_session()
-        self.notify_observers()
+        self._changed()
     
     def pause_timer(self):
         """Pause the timer."""
-        self.session_state['state'] = self.STATE_PAUSED
-        self.notify_observers()
+        self._state = self.STATE_PAUSED
+        self._changed()
+    
+    def _start_clock(self):
+        """Anchor the countdown to the monotonic clock."""
+        self._t0 = time.monotonic()
+        self._initial = self._current_time
+    
+    def ms_until_next_tick(self) -> int:
+        """Milliseconds until the countdown reaches its next whole second."""
+        elapsed = self._initial - self._current_time + 1
+        return max(1, int((self._t0 + elapsed - time.monotonic()) * 1000) + 1)
     
     def tick(self):
         """
-        Decrement timer by one second.
+        Sync the remaining time with the monotonic clock.
         Returns True if session is complete, False otherwise.
         """
-        if self.session_state['state'] != self.STATE_RUNNING:
+        if self._state != self.STATE_RUNNING:
             return False
         
-        self.session_state['current_time'] -= 1
-        
-        # Check if session is complete
-        if self.session_state['current_time'] <= 0:
-            self._complete_session()
-            return True
+        remaining = self._initial - int(time.monotonic() - self._t0)
+        if remaining == self._current_time:
+            return False
+        with self._batch():
+            self._current_time = remaining
+            self._changed()
+            
+            # Check if session is complete
+            if remaining <= 0:
+                self._complete_session()
+                return True
         
-        self.notify_observers()
         return False
     
     def _complete_session(self):
         """Handle session completion."""
-        session_type = self.session_state['session_type']
+        session_type = self._session_type
+        
+        # Start a new day's history if this completion crossed midnight
+        today = self._today()
+        if self.statistics['last_reset'] != today:
+            self._start_new_day(today)
         
         # Update statistics
+        duration = self._durations[session_type]
         if session_type == self.SESSION_WORK:
-            self.statistics['total_work_time'] += self.config['work_duration']
+            self.statistics['total_work_time'] += duration
             self.session_state['completed_work_sessions'] += 1
             self.statistics['sessions_completed'] += 1
-
-            # Log session with name
-            self.statistics['today_sessions'].append({
-                'type': 'work',
-                'name': self.session_state['current_session_name'],  # ← ADD THIS
-                'timestamp': datetime.now().isoformat(),
-                'duration': self.config['work_duration']
-            })
         else:
-            duration = (self.config['short_break_duration'] 
-               if session_type == self.SESSION_SHORT_BREAK 
-               else self.config['long_break_duration'])
             self.statistics['total_break_time'] += duration
             self.session_state['completed_break_sessions'] += 1
         
-            self.statistics['today_sessions'].append({
-            'type': 'break',
-            'name': self.session_state['current_session_name'],  # ← ADD THIS
-            'timestamp': datetime.now().isoformat(),
+        # Log session with name
+        record = {
+            'type': 'work' if session_type == self.SESSION_WORK else 'break',
+            'name': self.session_state['current_session_name'],
+            'timestamp': _now().isoformat(timespec='seconds'),
             'duration': duration
-        })
+        }
+        self.statistics['today_sessions'].append(record)
+        self._append_session(record)
         
         # Move to next session
         self._next_session()
         self._save_statistics()
-        self.notify_observers()
+        self._changed()
     
     def _next_session(self):
         """Transition to the next session type."""
-        current_type = self.session_state['session_type']
+        current_type = self._session_type
         
         if current_type == self.SESSION_WORK:
             # Check if it's time for a long break
             if self.session_state['current_cycle'] >= self.config['cycles_before_long_break']:
-                self.session_state['session_type'] = self.SESSION_LONG_BREAK
-                self.session_state['current_time'] = self.config['long_break_duration']
+                next_type = self.SESSION_LONG_BREAK
                 self.session_state['current_cycle'] = 1  # Reset cycle
             else:
-                self.session_state['session_type'] = self.SESSION_SHORT_BREAK
-                self.session_state['current_time'] = self.config['short_break_duration']
+                next_type = self.SESSION_SHORT_BREAK
                 self.session_state['current_cycle'] += 1
         else:
             # Break complete, go back to work
-            self.session_state['session_type'] = self.SESSION_WORK
-            self.session_state['current_time'] = self.config['work_duration']
+            next_type = self.SESSION_WORK
+        
+        self._session_type = next_type
+        self._total_time = self._durations[next_type]
+        self._current_time = self._total_time
         
         # Auto-start if configured
         if ((current_type == self.SESSION_WORK and self.config['auto_start_breaks']) or
             (current_type != self.SESSION_WORK and self.config['auto_start_work'])):
-            self.session_state['state'] = self.STATE_RUNNING
+            self._state = self.STATE_RUNNING
+            self._start_clock()
         else:
-            self.session_state['state'] = self.STATE_IDLE
+            self._state = self.STATE_IDLE
     
     def _reset_current_session(self):
         """Reset the current session timer."""
-        session_type = self.session_state['session_type']
-        
-        if session_type == self.SESSION_WORK:
-            self.session_state['current_time'] = self.config['work_duration']
-        elif session_type == self.SESSION_SHORT_BREAK:
-            self.session_state['current_time'] = self.config['short_break_duration']
-        else:
-            self.session_state['current_time'] = self.config['long_break_duration']
+        self._total_time = self._durations[self._session_type]
+        self._current_time = self._total_time
     
     def reset_all(self):
         """Reset all session data and cycles."""
+        self._current_time = self.config['work_duration']
+        self._session_type = self.SESSION_WORK
+        self._state = self.STATE_IDLE
         self.session_state.update({
-            'current_time': self.config['work_duration'],
-            'session_type': self.SESSION_WORK,
-            'state': self.STATE_IDLE,
             'current_cycle': 1,
             'completed_work_sessions': 0,
             'completed_break_sessions': 0,
         })
-        self.notify_observers()
+        self._total_time = self.config['work_duration']
+        self._changed()
     
     def update_config(self, config_updates: Dict):
         """Update configuration settings."""
         self.config.update(config_updates)
+        self._build_durations()
         self.session_state['total_cycles'] = self.config['cycles_before_long_break']
         self._reset_current_session()
-        self.notify_observers()
-    
-    def get_state_dict(self) -> Dict:
-        """Return complete state as dictionary."""
-        return {
-            'config': self.config.copy(),
-            'session': self.session_state.copy(),
-            'statistics': self.statistics.copy(),
+        self._changed()
+    
+    def _build_durations(self):
+        """Rebuild the session type to duration table from the config."""
+        self._durations = {
+            self.SESSION_WORK: self.config['work_duration'],
+            self.SESSION_SHORT_BREAK: self.config['short_break_duration'],
+            self.SESSION_LONG_BREAK: self.config['long_break_duration'],
         }
     
-    def get_progress_percentage(self) -> float:
-        """Calculate current session progress as percentage."""
-        session_type = self.session_state['session_type']
-        current_time = self.session_state['current_time']
-        
-        if session_type == self.SESSION_WORK:
-            total_time = self.config['work_duration']
-        elif session_type == self.SESSION_SHORT_BREAK:
-            total_time = self.config['short_break_duration']
-        else:
-            total_time = self.config['long_break_duration']
+    def _sync_session_state(self):
+        """Copy the hot attributes into session_state for readers."""
+        session_state = self.session_state
+        session_state['current_time'] = self._current_time
+        session_state['session_type'] = self._session_type
+        session_state['state'] = self._state
+    
+    @property
+    def state(self) -> str:
+        """Current timer state (one of the STATE_* constants)."""
+        return self._state
+    
+    @property
+    def session_type(self) -> str:
+        """Current session type (one of the SESSION_* constants)."""
+        return self._session_type
+    
+    def get_session_view(self) -> SessionView:
+        """Return a flat snapshot of the values the main window displays.
         
-        return ((total_time - current_time) / total_time) * 100 if total_time > 0 else 0
+        today_sessions is the model's live deque, not a copy; read it, don't keep it.
+        """
+        session_state = self.session_state
+        return SessionView(
+            self._state,
+            self._session_type,
+            self._current_time,
+            self._total_time,
+            session_state['current_cycle'],
+            session_state['total_cycles'],
+            session_state['completed_work_sessions'],
+            session_state['completed_break_sessions'],
+            self.statistics['today_sessions'],
+        )
+    
+    def get_progress_percentage(self) -> int:
+        """Calculate current session progress as a whole percentage."""
+        total_time = self._total_time
+        if total_time <= 0:
+            return 0
+        return ((total_time - self._current_time) * 100) // total_time
+    
+    def _today(self) -> str:
+        """Return today's date as YYYY-MM-DD."""
+        if time.time() >= self._next_midnight:
+            now = _now()
+            self._today_str = now.strftime('%Y-%m-%d')
+            tomorrow = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+            self._next_midnight = tomorrow.timestamp()
+        return self._today_str
+    
+    def _start_new_day(self, today: str):
+        """Clear today's sessions and compact the session log."""
+        self.statistics['today_sessions'].clear()
+        self.statistics['last_reset'] = today
+        self._save_q.put((self._write_sessions, ()))
+    
+    def _append_session(self, record: Dict):
+        """Queue one session record for the session log."""
+        self._save_q.put((self._write_record, record))
     
     def _save_statistics(self):
-        """Save statistics to file."""
-        try:
-            with open('data/pomodoro_stats.json', 'w') as f:
-                json.dump(self.statistics, f, indent=2)
-        except Exception as e:
-            print(f"Error saving statistics: {e}")
+        """Queue the statistics totals to be saved."""
+        meta = {key: self.statistics[key] for key in META_KEYS}
+        self._save_q.put((self._write_meta, meta))
+    
+    def _save_worker(self):
+        """Run queued writes in order until close() (saver thread)."""
+        while True:
+            job = self._save_q.get()
+            if job is None:
+                break
+            write, payload = job
+            try:
+                write(payload)
+            except Exception as e:
+                print(f"Error saving statistics: {e}")
+        
+        if self._session_fp is not None:
+            self._session_fp.close()
+            self._session_fp = None
+    
+    def _write_record(self, record: Dict):
+        """Append one session record to the session log."""
+        if self._session_fp is None:
+            self._session_fp = open(SESSIONS_FILE, 'ab')
+        self._session_fp.write(_dumps(record) + b'\n')
+        self._session_fp.flush()
+    
+    def _write_meta(self, meta: Dict):
+        """Write the totals file atomically via a temp file."""
+        tmp = META_FILE + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(_dumps(meta))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, META_FILE)
     
     def _load_statistics(self):
-        """Load statistics from file."""
+        """Load statistics from file, compacting the session log."""
         try:
-            if os.path.exists('data/pomodoro_stats.json'):
-                with open('data/pomodoro_stats.json', 'r') as f:
-                    saved_stats = json.load(f)
-                    
-                # Check if we need to reset daily stats
-                today = datetime.now().strftime('%Y-%m-%d')
-                if saved_stats.get('last_reset') != today:
-                    saved_stats['today_sessions'] = []
-                    saved_stats['last_reset'] = today
-                
-                self.statistics.update(saved_stats)
+            compact = False
+            if os.path.exists(META_FILE):
+                with open(META_FILE, 'rb') as f:
+                    saved_stats = _loads(f.read())
+                saved_stats['today_sessions'], intact = self._read_sessions()
+                # Rewrite a damaged log so new records don't land on a torn line
+                compact = not intact
+            elif os.path.exists(LEGACY_STATS_FILE):
+                # Migrate from the single-file format
+                with open(LEGACY_STATS_FILE, 'rb') as f:
+                    saved_stats = _loads(f.read())
+                compact = True
+            else:
+                return
+            
+            # Check if we need to reset daily stats
+            today = self._today()
+            if saved_stats.get('last_reset') != today:
+                saved_stats['today_sessions'] = []
+                saved_stats['last_reset'] = today
+                compact = True
+            
+            self.statistics['today_sessions'].extend(saved_stats.pop('today_sessions', []))
+            self.statistics.update(saved_stats)
+            if compact:
+                self._save_q.put((self._write_sessions, list(self.statistics['today_sessions'])))
+                self._save_statistics()
         except Exception as e:
             print(f"Error loading statistics: {e}")
     
+    def _read_sessions(self) -> Tuple[List[Dict], bool]:
+        """Read the tail of the session log, skipping unparsable lines.
+        
+        Also returns whether every line parsed and the log ends in a newline.
+        """
+        sessions = []
+        intact = True
+        if os.path.exists(SESSIONS_FILE):
+            with open(SESSIONS_FILE, 'rb') as f:
+                lines = deque(f, maxlen=MAX_SESSIONS)
+            if lines and not lines[-1].endswith(b'\n'):
+                intact = False
+            for line in lines:
+                try:
+                    sessions.append(_loads(line))
+                except ValueError:
+                    intact = False
+        return sessions, intact
+    
+    def _write_sessions(self, sessions):
+        """Rewrite the session log with only the given sessions."""
+        if self._session_fp is not None:
+            self._session_fp.close()
+            self._session_fp = None
+        with open(SESSIONS_FILE, 'wb') as f:
+            for record in sessions:
+                f.write(_dumps(record) + b'\n')
+    
+    def close(self, timeout: float = 2.0):
+        """Save statistics, then wait for pending writes and close the session log."""
+        self._save_statistics()
+        self._save_q.put(None)
+        self._saver.join(timeout)
+    
     def format_time(self, seconds: int) -> str:
         """Format seconds as MM:SS."""
-        minutes = seconds // 60
-        secs = seconds % 60
-        return f"{minutes:02d}:{secs:02d}"
+        return _format_mmss(seconds)
     
     def set_session_name(self, name: str):
         """Set the name for the current session."""
         self.session_state['current_session_name'] = name
-        self.notify_observers()
+        self._changed()
@@ -2,8 +2,11 @@
 Splash Screen with GIF Animation for Pomodoro Timer
 """
 
+import queue
+import threading
+import time
 import tkinter as tk
-from PIL import Image, ImageTk, ImageSequence
+from PIL import Image, ImageTk
 
 
 class SplashScreen:
@@ -24,7 +27,11 @@ class SplashScreen:
         self.root = None
         self.label = None
         self.frames = []
+        self._n_frames = 0
+        self._frame_queue = queue.Queue()  # Frames decoded by the worker thread
         self.is_playing = True
+        self._frame_ms = 80  # Adjust speed here
+        self._start = 0.0
 
     def show(self, parent=None):
         """Display the splash screen."""
@@ -63,7 +70,8 @@ class SplashScreen:
             self.root.deiconify()
 
         # Start animation
-        self._animate(0)
+        self._start = time.monotonic()
+        self._animate()
 
         # Close splash after duration
         self.root.after(self.duration, self._close)
@@ -72,27 +80,55 @@ class SplashScreen:
         self.root.wait_window()
 
     def _load_gif(self):
-        """This method loads all frames from the GIF."""
+        """This method loads the first frame and decodes the rest in the background."""
         try:
             gif = Image.open(self.gif_path)
-            for frame in ImageSequence.Iterator(gif):
-                frame_image = ImageTk.PhotoImage(frame.copy())
-                self.frames.append(frame_image)
+            self._n_frames = getattr(gif, 'n_frames', 1)
+            # convert() already returns an independent image, no copy() needed
+            self.frames.append(ImageTk.PhotoImage(gif.convert('RGBA')))
         except Exception as e:
             print(f"Error loading GIF: {e}")
             self.frames = []
+            return
+
+        if self._n_frames > 1:
+            threading.Thread(target=self._decode_rest, args=(gif,), daemon=True).start()
+        else:
+            gif.close()
+
+    def _decode_rest(self, gif):
+        """This method decodes the remaining frames off the Tk thread."""
+        try:
+            with gif:
+                for index in range(1, self._n_frames):
+                    gif.seek(index)
+                    self._frame_queue.put(gif.convert('RGBA'))
+        except Exception as e:
+            print(f"Error loading GIF: {e}")
 
-    def _animate(self, index):
-        """This method animates GIF frames recursively."""
+    def _ingest_frames(self):
+        """This method wraps decoded frames as PhotoImages (Tk thread only)."""
+        while True:
+            try:
+                frame = self._frame_queue.get_nowait()
+            except queue.Empty:
+                return
+            self.frames.append(ImageTk.PhotoImage(frame))
+
+    def _animate(self):
+        """This method shows the frame due at the current time, dropping late ones."""
         if not self.is_playing or not self.frames:
             return
 
-        frame = self.frames[index]
+        self._ingest_frames()
+        elapsed_ms = (time.monotonic() - self._start) * 1000
+        index = int(elapsed_ms / self._frame_ms) % self._n_frames
+        # Frames not decoded yet fall back to the latest one available
+        frame = self.frames[min(index, len(self.frames) - 1)]
         self.label.config(image=frame)
         self.label.image = frame  # Keep reference
 
-        next_index = (index + 1) % len(self.frames)
-        self.root.after(80, self._animate, next_index)  # Adjust speed here
+        self.root.after(self._frame_ms, self._animate)
 
     def _show_fallback(self):
         """Show fallback text if GIF fails."""
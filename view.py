@@ -1,11 +1,58 @@
 
 
+import queue
+import threading
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
-import math
+from tkinter import font as tkfont
+from itertools import islice
 from typing import Dict, Callable
-from unicodedata import name
-from PIL import Image, ImageTk, ImageSequence
+from PIL import Image, ImageTk
+
+
+# Splash GIFs with more frames than this share one PhotoImage fed PPM data
+_MAX_PHOTO_FRAMES = 20
+
+
+# Splash background that transparent GIF pixels are composited onto
+_SPLASH_BG = (255, 255, 255)
+
+
+def _flatten_frame(frame):
+    """Composite a GIF frame onto the splash background as a new RGB image."""
+    rgba = frame.convert('RGBA')
+    flat = Image.new('RGB', rgba.size, _SPLASH_BG)
+    flat.paste(rgba, mask=rgba.getchannel('A'))
+    return flat
+
+
+def _encode_ppm(frame) -> bytes:
+    """Encode a PIL frame as binary PPM data for PhotoImage(data=...)."""
+    rgb = _flatten_frame(frame)
+    header = b'P6 %d %d 255\n' % rgb.size
+    return header + rgb.tobytes()
+
+
+# Fonts of the main window, turned into shared tkfont.Font objects by PomodoroView
+_FONT_SPECS = {
+    'small': ('Helvetica', 10, 'normal'),
+    'small_bold': ('Helvetica', 10, 'bold'),
+    'entry': ('Helvetica', 12, 'normal'),
+    'cycle': ('Helvetica', 14, 'bold'),
+    'icon': ('Helvetica', 16, 'normal'),
+    'heading': ('Helvetica', 16, 'bold'),
+    'counter': ('Helvetica', 24, 'bold'),
+    'timer': ('Helvetica', 48, 'bold'),
+}
+
+
+# Display text for each session type
+_SESSION_LABELS = {
+    'work': "Work Session",
+    'short_break': "Short Break",
+    'long_break': "Long Break",
+}
 
 
 class PomodoroView:
@@ -33,6 +80,19 @@ class PomodoroView:
         'progress_bg': '#D5F4E6',
     }
     
+    # "MM:SS" for every second up to the longest configurable session (60 min)
+    _TIME_STRINGS = [f"{t // 60:02d}:{t % 60:02d}" for t in range(3601)]
+    
+    # Minimum time between two display renders
+    MIN_REFRESH_MS = 100
+    
+    # How long a notification toast stays up
+    NOTIFY_MS = 2500
+    
+    # Arc extent per half-degree progress bucket; negative draws clockwise from 90 degrees
+    _EXTENT_STEPS = 720
+    _EXTENT_TABLE = [-i / 2 for i in range(_EXTENT_STEPS + 1)]
+    
     def __init__(self, root: tk.Tk):
         """Initialize the view with the root window."""
         self.root = root
@@ -49,14 +109,52 @@ class PomodoroView:
         # Current color scheme
         self.current_colors = self.WORK_COLORS
 
+        # Named fonts need a root, so they are built here rather than at import
+        self.fonts = {
+            name: tkfont.Font(root=self.root, family=family, size=size, weight=weight)
+            for name, (family, size, weight) in _FONT_SPECS.items()
+        }
+
+        # Themed widget styles; the colors are filled in by _apply_theme
+        self.style = ttk.Style(self.root)
+        self._init_styles()
+
+        # Display text, shared by the labels across widget rebuilds
+        self.cycle_var = tk.StringVar(value="CYCLE 1/4")
+        self.session_var = tk.StringVar(value="Work Session")
+        self.time_var = tk.StringVar(value="25:00")
+        self.work_var = tk.StringVar(value="0")
+        self.break_var = tk.StringVar(value="0")
+
+        # Direct Tcl access for the per-tick display writes
+        self._tk_call = self.root.tk.call
+        self._setvar = self.root.tk.globalsetvar
+        self._var_names = {
+            'cycle': str(self.cycle_var),
+            'session': str(self.session_var),
+            'time': str(self.time_var),
+            'work': str(self.work_var),
+            'break': str(self.break_var),
+        }
+
         # --- Splash Screen Setup ---
         splash_gif: str = "assets/splashwork.gif"
         splash_duration: int = 4000
         self.splash_gif = splash_gif
         self.splash_duration = splash_duration
         self.frames = []
+        self._frame_names = []  # Tcl image names of self.frames
+        self.frame_delays = []  # Encoded display time of each frame in ms
+        self._frame_data = []  # Binary PPM data of each frame, for large GIFs
+        self._splash_photo = None  # Single PhotoImage showing _frame_data
+        self.n_frames = 0
+        self._frame_queue = queue.Queue()  # Frames decoded by the worker thread
         self.current_frame = 0
         self.animating = False
+        self._anim_after = None
+
+        # Settings dialog, created on first use
+        self._settings_dialog = None
 
         self.splash_frame = tk.Frame(self.root, bg="#ffffff")
         self.splash_frame.pack(fill="both", expand=True)
@@ -64,13 +162,27 @@ class PomodoroView:
         self._load_gif_frames()
         self.gif_label = tk.Label(self.splash_frame, bg="#ffffff") #self.current_colors['bg']
         self.gif_label.place(relx=0.5, rely=0.5, anchor="center")
+        if self._splash_photo is not None:
+            self.gif_label.config(image=self._splash_photo)
+        self._label_w = self.gif_label._w
         
         # Optional splash loading text
         # self.loading_text = tk.Label(self.splash_frame, text="Loading...", font=("Helvetica", 10), bg="#ffffff", fg="#666")
         # self.loading_text.place(relx=0.5, rely=0.8, anchor="center")
 
         # --- Main Pomodoro Frame ---
-        self.main_frame = tk.Frame(self.root, bg="#F0F4F8")
+        # Built behind the splash by _deferred_init_main; until then
+        # update_display only remembers the latest state
+        self._main_ready = False
+        self._pending_state = None
+        self._flush_scheduled = False
+        self._deferred_view = None  # Latest view whose non-clock parts are pending
+        self._last_render = 0.0  # time.monotonic() of the last render
+
+        # Skip rendering while the window is minimized; catch up when it is restored
+        self._visible = True
+        self.root.bind('<Map>', self._on_map, add='+')
+        self.root.bind('<Unmap>', self._on_unmap, add='+')
         
         # Controller callbacks (to be set by controller)
         self.on_start_stop: Callable = None
@@ -83,51 +195,125 @@ class PomodoroView:
         # Start splash
         self.show_splash()
 
-        # Schedule switch to main app
+        # Build the main UI once the splash is on screen, then switch to it
+        self.root.after(200, self._deferred_init_main)
         self.root.after(self.splash_duration, self.show_main)
-        
-        # Create UI components
-        self._create_widgets()
-        self._apply_theme(self.WORK_COLORS)
 
     # ---------------- SPLASH SCREEN ----------------
     def _load_gif_frames(self):
-        """Load all frames from the GIF."""
+        """Load the first GIF frame now and the rest in the background."""
+        gif = self._load_first_frame()
+        if self.n_frames > 1:
+            encode = self._splash_photo is not None
+            threading.Thread(target=self._load_rest_frames_bg, args=(gif, encode), daemon=True).start()
+        else:
+            gif.close()
+
+    def _load_first_frame(self):
+        """Open the GIF and decode its first frame on the Tk thread."""
         gif = Image.open(self.splash_gif)
-        for frame in ImageSequence.Iterator(gif):
-            self.frames.append(ImageTk.PhotoImage(frame))
+        self.n_frames = getattr(gif, 'n_frames', 1)
+        if self.n_frames > _MAX_PHOTO_FRAMES:
+            # One shared image instead of a Tk image per frame
+            self._splash_photo = tk.PhotoImage(width=gif.width, height=gif.height)
+            self._append_frame(_encode_ppm(gif), gif.info)
+        else:
+            self._append_frame(_flatten_frame(gif), gif.info)
+        return gif
+
+    def _load_rest_frames_bg(self, gif, encode: bool):
+        """Decode the remaining frames off the Tk thread."""
+        with gif:
+            for index in range(1, self.n_frames):
+                gif.seek(index)
+                frame = _encode_ppm(gif) if encode else _flatten_frame(gif)
+                self._frame_queue.put((frame, dict(gif.info)))
+
+    def _append_frame(self, frame, info: Dict):
+        """Store a decoded frame, wrapping it as a PhotoImage if needed (Tk thread only)."""
+        if isinstance(frame, bytes):
+            self._frame_data.append(frame)
+        else:
+            photo = ImageTk.PhotoImage(frame)
+            self.frames.append(photo)
+            self._frame_names.append(str(photo))
+        self.frame_delays.append(int(info.get('duration') or 50))
+
+    def _ingest_frames(self):
+        """Pick up frames the worker thread has decoded so far."""
+        while True:
+            try:
+                frame, info = self._frame_queue.get_nowait()
+            except queue.Empty:
+                return
+            self._append_frame(frame, info)
 
     def _animate_gif(self):
         """Loop GIF frames."""
         if not self.animating:
             return
-        self.gif_label.config(image=self.frames[self.current_frame])
-        self.current_frame = (self.current_frame + 1) % len(self.frames)
-        self.root.after(50, self._animate_gif)
+        t0 = time.perf_counter()
+        self._ingest_frames()
+        # Frames not decoded yet fall back to the latest one available
+        index = min(self.current_frame, len(self.frame_delays) - 1)
+        if self.splash_frame.winfo_ismapped():
+            if self._splash_photo is not None:
+                self._splash_photo.configure(data=self._frame_data[index])
+            else:
+                self.gif_label.tk.call(self._label_w, 'configure', '-image', self._frame_names[index])
+            # Flush the redraw now so its cost counts against this frame's delay
+            self.root.update_idletasks()
+        self.current_frame = (self.current_frame + 1) % self.n_frames
+        # Shorten the wait by the time spent here so slow frames don't pile up
+        elapsed_ms = (time.perf_counter() - t0) * 1000
+        delay = max(1, int(self.frame_delays[index] - elapsed_ms))
+        self._anim_after = self.root.after(delay, self._animate_gif)
 
     def show_splash(self):
         """Display splash and start animation."""
-        self.main_frame.pack_forget()
-        self.splash_frame.pack(fill="both", expand=True)
+        # Skip (re)packing what is already managed; each pack call relayouts the root
+        if not self.splash_frame.winfo_manager():
+            self.splash_frame.pack(fill="both", expand=True)
         self.animating = True
         self._animate_gif()
 
     def show_main(self):
         """Switch to main Pomodoro view with scroll support."""
+        if self._anim_after:
+            self.root.after_cancel(self._anim_after)
+            self._anim_after = None
         self.animating = False
-        self.splash_frame.pack_forget()
+        if self.splash_frame.winfo_manager():
+            self.splash_frame.pack_forget()
+
+        # The splash is done for good; release its frame images
+        self.gif_label.config(image='')
+        self.frames = []
+        self._frame_names = []
+        self.frame_delays = []
+        self._frame_data = []
+        self._splash_photo = None
+
+        if not self._main_ready:
+            self._deferred_init_main()
+        if not self.scroll_canvas.winfo_manager():
+            self.scroll_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+    def _deferred_init_main(self):
+        """Build the scrollable main UI (not packed yet) while the splash plays."""
+        if self._main_ready:
+            return
 
         # Create a canvas to enable scrolling
         self.scroll_canvas = tk.Canvas(self.root, bg="#F0F4F8", highlightthickness=0)
-        self.scroll_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
         # Add scrollbar
         self.scrollbar = ttk.Scrollbar(self.root, orient="vertical", command=self.scroll_canvas.yview)
-        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.scroll_canvas.configure(yscrollcommand=self.scrollbar.set)
 
         # Create a frame inside the canvas for your actual widgets
-        self.main_frame = tk.Frame(self.scroll_canvas, bg="#F0F4F8")
+        self.main_frame = ttk.Frame(self.scroll_canvas, style='Themed.TFrame')
         self.scroll_window = self.scroll_canvas.create_window((0, 0), window=self.main_frame, anchor="nw")
 
         # Configure scrolling region
@@ -142,10 +328,17 @@ class PomodoroView:
 
         # Create your widgets inside this scrollable main_frame
         self._create_widgets()
-        self._apply_theme(self.WORK_COLORS)
+        self._create_notification()
+        self._main_ready = True
+
+        # Catch up with any state that arrived before the widgets existed
+        self._flush_display()
 
     def _create_widgets(self):
         """Create all UI widgets."""
+        # Fresh widgets, so forget the values applied to any previous ones
+        self._last = {}
+        self._applied_colors = None
         # Top section - Cycle indicator
         self._create_cycle_section()
         # Middle section - Timer circle
@@ -159,6 +352,31 @@ class PomodoroView:
         self._create_settings_button()
         self._apply_theme(self.WORK_COLORS)
 
+    def _init_styles(self):
+        """Set up the color-independent parts of the ttk styles."""
+        style = self.style
+        # 'clam' honors background colors on every platform, unlike the native themes
+        style.theme_use('clam')
+        button = {'foreground': 'white', 'relief': tk.FLAT, 'borderwidth': 0, 'padding': (14, 8)}
+        style.configure('Primary.TButton', font=self.fonts['heading'], **button)
+        style.configure('Stop.TButton', font=self.fonts['heading'], background='#E74C3C', **button)
+        style.configure('Icon.TButton', font=self.fonts['icon'], relief=tk.FLAT, borderwidth=0)
+
+    def _configure_styles(self, colors: Dict):
+        """Point the ttk styles at a color theme; every widget using them follows."""
+        style = self.style
+        bg = colors['bg']
+        style.configure('Themed.TFrame', background=bg)
+        style.configure('Text.TLabel', background=bg, foreground=colors['text'])
+        style.configure('Primary.TLabel', background=bg, foreground=colors['primary'])
+        style.configure('Work.TLabel', background=bg, foreground=self.WORK_COLORS['primary'])
+        style.configure('Break.TLabel', background=bg, foreground=self.BREAK_COLORS['primary'])
+        style.configure('Primary.TButton', background=colors['primary'])
+        style.map('Primary.TButton', background=[('active', colors['secondary'])])
+        style.map('Stop.TButton', background=[('active', colors['secondary'])])
+        style.configure('Icon.TButton', background=bg, foreground=colors['text'])
+        style.map('Icon.TButton', background=[('active', bg)])
+
     def center_window(self, width, height):
         """Centers the window on the screen."""
         screen_width = self.root.winfo_screenwidth()
@@ -169,21 +387,21 @@ class PomodoroView:
     
     def _create_cycle_section(self):
         """Create cycle indicator at the top."""
-        cycle_frame = tk.Frame(self.main_frame, bg=self.current_colors['bg'])
+        cycle_frame = ttk.Frame(self.main_frame, style='Themed.TFrame')
         cycle_frame.pack(fill=tk.X, pady=(0, 20))
         
-        self.cycle_label = tk.Label(
+        self.cycle_label = ttk.Label(
             cycle_frame,
-            text="CYCLE 1/4",
-            font=('Helvetica', 14, 'bold'),
-            bg=self.current_colors['bg'],
-            fg=self.current_colors['text']
+            textvariable=self.cycle_var,
+            font=self.fonts['cycle'],
+            style='Text.TLabel'
         )
         self.cycle_label.pack()
     
     def _create_timer_section(self):
         """Create the main circular timer display."""
-        timer_frame = tk.Frame(self.main_frame, bg=self.current_colors['bg'])
+        colors = self.current_colors
+        timer_frame = ttk.Frame(self.main_frame, style='Themed.TFrame')
         timer_frame.pack(pady=20)
         
         # Canvas for circular progress
@@ -191,19 +409,19 @@ class PomodoroView:
             timer_frame,
             width=300,
             height=300,
-            bg=self.current_colors['bg'],
+            bg=colors['bg'],
             highlightthickness=0
         )
         self.canvas.pack()
+        # Direct Tcl access for the per-tick arc update
+        self._cv_call = self.canvas.tk.call
+        self._cv_w = self.canvas._w
         
-        # Draw progress circle background
-        self.progress_bg_arc = self.canvas.create_arc(
+        # Draw progress circle background (a plain oval, it never changes extent)
+        self.progress_bg_arc = self.canvas.create_oval(
             20, 20, 280, 280,
-            start=90,
-            extent=359.99,
-            outline=self.current_colors['progress_bg'],
-            width=15,
-            style=tk.ARC
+            outline=colors['progress_bg'],
+            width=15
         )
         
         # Draw progress circle
@@ -211,65 +429,62 @@ class PomodoroView:
             20, 20, 280, 280,
             start=90,
             extent=0,
-            outline=self.current_colors['progress'],
+            outline=colors['progress'],
             width=15,
             style=tk.ARC
         )
         
         # Session type label
-        self.session_label = tk.Label(
+        self.session_label = ttk.Label(
             self.canvas,
-            text="Work Session",
-            font=('Helvetica', 16, 'bold'),
-            bg=self.current_colors['bg'],
-            fg=self.current_colors['primary']
+            textvariable=self.session_var,
+            font=self.fonts['heading'],
+            style='Primary.TLabel'
         )
         self.canvas.create_window(150, 110, window=self.session_label)
         
         # Time label
-        self.time_label = tk.Label(
+        self.time_label = ttk.Label(
             self.canvas,
-            text="25:00",
-            font=('Helvetica', 48, 'bold'),
-            bg=self.current_colors['bg'],
-            fg=self.current_colors['text']
+            textvariable=self.time_var,
+            font=self.fonts['timer'],
+            style='Text.TLabel'
         )
         self.canvas.create_window(150, 170, window=self.time_label)
 
 
     def _create_session_name_section(self):
         """Create session name input section."""
-        name_frame = tk.Frame(self.main_frame, bg=self.current_colors['bg'])
+        colors = self.current_colors
+        name_frame = ttk.Frame(self.main_frame, style='Themed.TFrame')
         name_frame.pack(pady=10, fill=tk.X)
 
         # Label with dynamic session name display
-        self.name_label = tk.Label(
+        self.name_label = ttk.Label(
             name_frame,
             text="✏ Name this session:",
-            font=('Helvetica', 10, 'bold'),
-            bg=self.current_colors['bg'],
-            fg=self.current_colors['text']
+            font=self.fonts['small_bold'],
+            style='Text.TLabel'
         )
         self.name_label.pack(padx=(0, 5))
 
         # Label to display chosen session name
-        self.session_display_label = tk.Label(
+        self.session_display_label = ttk.Label(
             name_frame,
             text="",  # will update after user enters name
-            font=('Helvetica', 10, 'bold'),
-            bg=self.current_colors['bg'],
-            fg=self.current_colors['primary']
+            font=self.fonts['small_bold'],
+            style='Primary.TLabel'
         )
         self.session_display_label.pack()
 
         # Frame for entry + button
-        entry_frame = tk.Frame(self.main_frame, bg=self.current_colors['bg'])
+        entry_frame = ttk.Frame(self.main_frame, style='Themed.TFrame')
         entry_frame.pack(pady=5)
 
         # Entry field
         self.session_name_entry = tk.Entry(
             entry_frame,
-            font=('Helvetica', 12),
+            font=self.fonts['entry'],
             bg='white',
             fg='#999',
             width=25,
@@ -291,8 +506,8 @@ class PomodoroView:
         confirm_btn = tk.Button(
             entry_frame,
             text="✔",
-            font=('Helvetica', 10, 'bold'),
-            bg=self.current_colors['primary'],
+            font=self.fonts['small_bold'],
+            bg=colors['primary'],
             fg='white',
             relief=tk.FLAT,
             cursor='hand2',
@@ -318,48 +533,44 @@ class PomodoroView:
     
     def _create_progress_section(self):
         """Create progress indicators section."""
-        progress_frame = tk.Frame(self.main_frame, bg=self.current_colors['bg'])
+        progress_frame = ttk.Frame(self.main_frame, style='Themed.TFrame')
         progress_frame.pack(pady=20, fill=tk.X)
         
         # Work sessions indicator
-        work_frame = tk.Frame(progress_frame, bg=self.current_colors['bg'])
+        work_frame = ttk.Frame(progress_frame, style='Themed.TFrame')
         work_frame.pack(side=tk.LEFT, expand=True, padx=10)
         
-        tk.Label(
+        ttk.Label(
             work_frame,
             text="Work Sessions",
-            font=('Helvetica', 10),
-            bg=self.current_colors['bg'],
-            fg=self.current_colors['text']
+            font=self.fonts['small'],
+            style='Text.TLabel'
         ).pack()
         
-        self.work_progress = tk.Label(
+        self.work_progress = ttk.Label(
             work_frame,
-            text="0",
-            font=('Helvetica', 24, 'bold'),
-            bg=self.current_colors['bg'],
-            fg=self.WORK_COLORS['primary']
+            textvariable=self.work_var,
+            font=self.fonts['counter'],
+            style='Work.TLabel'
         )
         self.work_progress.pack()
         
         # Break sessions indicator
-        break_frame = tk.Frame(progress_frame, bg=self.current_colors['bg'])
+        break_frame = ttk.Frame(progress_frame, style='Themed.TFrame')
         break_frame.pack(side=tk.LEFT, expand=True, padx=10)
         
-        tk.Label(
+        ttk.Label(
             break_frame,
             text="Breaks",
-            font=('Helvetica', 10),
-            bg=self.current_colors['bg'],
-            fg=self.current_colors['text']
+            font=self.fonts['small'],
+            style='Text.TLabel'
         ).pack()
         
-        self.break_progress = tk.Label(
+        self.break_progress = ttk.Label(
             break_frame,
-            text="0",
-            font=('Helvetica', 24, 'bold'),
-            bg=self.current_colors['bg'],
-            fg=self.BREAK_COLORS['primary']
+            textvariable=self.break_var,
+            font=self.fonts['counter'],
+            style='Break.TLabel'
         )
         self.break_progress.pack()
         
@@ -368,15 +579,15 @@ class PomodoroView:
     
     def _create_mini_graph(self, parent):
         """Create a mini graph showing session distribution."""
-        graph_frame = tk.Frame(parent, bg=self.current_colors['bg'])
+        colors = self.current_colors
+        graph_frame = ttk.Frame(parent, style='Themed.TFrame')
         graph_frame.pack(pady=10, fill=tk.X)
         
-        tk.Label(
+        ttk.Label(
             graph_frame,
             text="Today's Progress",
-            font=('Helvetica', 10),
-            bg=self.current_colors['bg'],
-            fg=self.current_colors['text']
+            font=self.fonts['small'],
+            style='Text.TLabel'
         ).pack()
         
         # Canvas for mini bar graph
@@ -384,43 +595,41 @@ class PomodoroView:
             graph_frame,
             width=400,
             height=60,
-            bg=self.current_colors['bg'],
+            bg=colors['bg'],
             highlightthickness=0
         )
         self.graph_canvas.pack(pady=5)
+        
+        # Bars are painted into one image; blank pixels let the canvas bg show through
+        self._graph_img = tk.PhotoImage(width=400, height=60)
+        self.graph_canvas.create_image(0, 0, anchor='nw', image=self._graph_img)
+        # Length and newest session seen by the last update
+        self._graph_len = None
+        self._graph_tail = None
     
     def _create_control_section(self):
         """Create control buttons section."""
-        control_frame = tk.Frame(self.main_frame, bg=self.current_colors['bg'])
+        control_frame = ttk.Frame(self.main_frame, style='Themed.TFrame')
         control_frame.pack()
-        
-        # --- Button Style Settings ---
-        btn_style = {
-            "font": ("Helvetica", 16, "bold"),
-            "fg": "white",
-            "relief": tk.FLAT,
-            "cursor": "hand2",
-        }
 
         # --- START Button ---
-        self.start_stop_btn = tk.Button(
+        self.start_stop_btn = ttk.Button(
             control_frame,
             text="START",
-            bg=self.current_colors["primary"],
-            activebackground=self.current_colors["secondary"],
-            command=self._handle_start_stop,
-            **btn_style
+            style='Primary.TButton',
+            cursor='hand2',
+            command=self._handle_start_stop
         )
         self.start_stop_btn.grid(row=0, column=0, padx=10, pady=10)
+        self._start_stop_w = self.start_stop_btn._w
         
         # --- RESET Button ---
-        self.reset_btn = tk.Button(
+        self.reset_btn = ttk.Button(
             control_frame,
             text="RESET",
-            bg=self.current_colors["primary"],
-            activebackground=self.current_colors["secondary"],
-            command=self._handle_reset,
-            **btn_style
+            style='Primary.TButton',
+            cursor='hand2',
+            command=self._handle_reset
         )
         self.reset_btn.grid(row=0, column=1, padx=10, pady=10)
 
@@ -431,26 +640,20 @@ class PomodoroView:
     def _create_settings_button(self):
         """Create settings and history buttons in top right."""
     # Settings button
-        settings_btn = tk.Button(
+        settings_btn = ttk.Button(
         self.main_frame,
         text="⚙",
-        font=('Helvetica', 16),
-        bg=self.current_colors['bg'],
-        fg=self.current_colors['text'],
-        relief=tk.FLAT,
+        style='Icon.TButton',
         cursor='hand2',
         command=self._handle_settings
     )
         settings_btn.place(relx=1.0, rely=0.0, anchor='ne')
     
     # History button (left of settings)
-        history_btn = tk.Button(
+        history_btn = ttk.Button(
         self.main_frame,
         text="📜",
-        font=('Helvetica', 16),
-        bg=self.current_colors['bg'],
-        fg=self.current_colors['text'],
-        relief=tk.FLAT,
+        style='Icon.TButton',
         cursor='hand2',
         command=self._handle_history
     )
@@ -462,11 +665,6 @@ class PomodoroView:
         if self.on_start_stop:
             self.on_start_stop()
 
-    def _handle_history(self):
-            """Handle history button click."""
-            if self.on_history:
-                self.on_history()
-    
     def _handle_reset(self):
         """Handle reset button click."""
         if self.on_reset:
@@ -483,160 +681,232 @@ class PomodoroView:
         if self.on_history:
             self.on_history()
         
-    def update_display(self, state: Dict):
-        """Update all display elements based on state."""
-        session = state['session']
-        statistics = state['statistics']
+    def update_display(self, state):
+        """Schedule a display update; updates coalesce and render at most every MIN_REFRESH_MS."""
+        self._pending_state = state
+        if self._main_ready and self._visible and not self._flush_scheduled:
+            self._flush_scheduled = True
+            wait_ms = self.MIN_REFRESH_MS - (time.monotonic() - self._last_render) * 1000
+            if wait_ms > 0:
+                self.root.after(int(wait_ms) + 1, self._flush_display)
+            else:
+                self.root.after_idle(self._flush_display)
+    
+    def _flush_display(self):
+        """Render the latest pending state, if any."""
+        self._flush_scheduled = False
+        if not self._visible:
+            return  # Keep the state pending until the window is mapped again
+        state, self._pending_state = self._pending_state, None
+        if state is not None:
+            self._last_render = time.monotonic()
+            self._render_display(state)
+    
+    def _on_map(self, event):
+        """Resume rendering when the main window is shown again."""
+        # Child widgets' <Map> events also reach the root's binding
+        if event.widget is not self.root:
+            return
+        self._visible = True
+        if self._pending_state is not None:
+            self.update_display(self._pending_state)
+    
+    def _on_unmap(self, event):
+        """Pause rendering while the main window is minimized or withdrawn."""
+        if event.widget is self.root:
+            self._visible = False
+    
+    def _render_display(self, view):
+        """Update the clock now and the rest of the display once Tk is idle."""
+        # Time-critical: the time label and the progress ring
+        current_time = view.current_time
+        if 0 <= current_time <= 3600:
+            time_text = self._TIME_STRINGS[current_time]
+        else:
+            minutes, seconds = divmod(current_time, 60)
+            time_text = f"{minutes:02d}:{seconds:02d}"
+        self._set_if_changed('time', time_text)
+        self._update_progress_arc(current_time, view.total_time)
         
-        # Update cycle label
-        self.cycle_label.config(
-            text=f"CYCLE {session['current_cycle']}/{session['total_cycles']}"
-        )
+        # Everything else coalesces into one idle callback
+        if self._deferred_view is None:
+            self.root.after_idle(self._render_deferred)
+        self._deferred_view = view
+    
+    def _render_deferred(self):
+        """Update the non-clock display elements from the latest view."""
+        view, self._deferred_view = self._deferred_view, None
+        if view is None:
+            return
         
-        # Update time label
-        minutes = session['current_time'] // 60
-        seconds = session['current_time'] % 60
-        self.time_label.config(text=f"{minutes:02d}:{seconds:02d}")
+        # Update cycle label
+        self._set_if_changed('cycle', f"CYCLE {view.current_cycle}/{view.total_cycles}")
         
         # Update session label
-        session_type = session['session_type']
-        if session_type == 'work':
-            self.session_label.config(text="Work Session")
-        elif session_type == 'short_break':
-            self.session_label.config(text="Short Break")
-        else:
-            self.session_label.config(text="Long Break")
+        session_type = view.session_type
+        self._set_if_changed('session', _SESSION_LABELS[session_type])
         
         # Update progress counters
-        self.work_progress.config(text=str(session['completed_work_sessions']))
-        self.break_progress.config(text=str(session['completed_break_sessions']))
+        self._set_if_changed('work', str(view.work_done))
+        self._set_if_changed('break', str(view.break_done))
         
         # Update start/stop button
-        if session['state'] == 'running':
-            self.start_stop_btn.config(
-                text="STOP",
-                bg='#E74C3C'
-            )
+        if view.state == 'running':
+            button_text, button_style = "STOP", 'Stop.TButton'
         else:
-            self.start_stop_btn.config(
-                text="START",
-                bg=self.current_colors['primary']
-            )
+            button_text, button_style = "START", 'Primary.TButton'
+        if self._last.get('start_stop') != button_text:
+            self._tk_call(self._start_stop_w, 'configure', '-text', button_text, '-style', button_style)
+            self._last['start_stop'] = button_text
         
         # Update color theme based on session type
-        if session_type == 'work':
-            if self.current_colors != self.WORK_COLORS:
-                self._apply_theme(self.WORK_COLORS)
-        else:
-            if self.current_colors != self.BREAK_COLORS:
-                self._apply_theme(self.BREAK_COLORS)
-        
-        # Update progress arc
-        self._update_progress_arc(state)
+        colors = self.WORK_COLORS if session_type == 'work' else self.BREAK_COLORS
+        if colors is not self._applied_colors:
+            self._apply_theme(colors)
         
         # Update mini graph
-        self._update_mini_graph(statistics['today_sessions'])
+        self._update_mini_graph(view.today_sessions)
     
-    def _update_progress_arc(self, state: Dict):
+    def _update_progress_arc(self, current_time: int, total_time: int):
         """Update the circular progress indicator."""
-        session = state['session']
-        session_type = session['session_type']
-        current_time = session['current_time']
-        
-        # Get total time for current session
-        if session_type == 'work':
-            total_time = state['config']['work_duration']
-        elif session_type == 'short_break':
-            total_time = state['config']['short_break_duration']
+        # Progress in half-degree buckets, since finer steps aren't visible
+        if total_time > 0:
+            bucket = (total_time - current_time) * self._EXTENT_STEPS // total_time
+            bucket = min(max(bucket, 0), self._EXTENT_STEPS)
         else:
-            total_time = state['config']['long_break_duration']
-        
-        # Calculate progress
-        # progress = ((total_time - current_time) / total_time) * 100 if total_time > 0 else 0
-        # extent = -359.99 * (progress / 100)
-
-        # Calculate progress fraction (0..1)
-        progress_frac = ((total_time - current_time) / total_time) if total_time > 0 else 0.0
-        # extent in degrees; negative value to draw clockwise from 90 degrees
-        extent = -360.0 * progress_frac
+            bucket = 0
         
         # Update arc
-        self.canvas.itemconfig(self.progress_arc, extent=extent)
+        if self._last.get('extent') != bucket:
+            self._cv_call(self._cv_w, 'itemconfigure', self.progress_arc,
+                          '-extent', self._EXTENT_TABLE[bucket])
+            self._last['extent'] = bucket
+    
+    def _set_if_changed(self, key: str, value: str):
+        """Set a display variable only if the value differs from the last one set."""
+        if self._last.get(key) != value:
+            self._setvar(self._var_names[key], value)
+            self._last[key] = value
     
     def _update_mini_graph(self, sessions: list):
         """Update the mini bar graph."""
-        self.graph_canvas.delete('all')
-        
-        if not sessions:
+        # Sessions are only ever appended, so same length and same newest
+        # session means nothing changed
+        tail = sessions[-1] if sessions else None
+        if len(sessions) == self._graph_len and tail is self._graph_tail:
             return
+        self._graph_len = len(sessions)
+        self._graph_tail = tail
         
         # Show last 10 sessions
-        recent_sessions = sessions[-10:]
+        recent_sessions = islice(sessions, max(len(sessions) - 10, 0), None)
         bar_width = 35
         bar_spacing = 5
         max_height = 50
         
+        graph_img = self._graph_img
+        graph_img.blank()
         for i, session in enumerate(recent_sessions):
             x = i * (bar_width + bar_spacing) + 10
             # Normalize height based on duration
             height = (session['duration'] / 1500) * max_height  # 1500s = 25min
-            height = min(height, max_height)
+            height = int(min(height, max_height))
+            if height <= 0:
+                continue
             
             color = self.WORK_COLORS['primary'] if session['type'] == 'work' else self.BREAK_COLORS['primary']
-            
-            self.graph_canvas.create_rectangle(
-                x, max_height - height + 5,
-                x + bar_width, max_height + 5,
-                fill=color,
-                outline=''
-            )
+            graph_img.put(color, to=(x, max_height - height + 5, x + bar_width, max_height + 5))
 
     def _apply_theme(self, colors: Dict):
         """Apply color theme to all UI elements."""
+        # Identity check: the themes are the class-level color dicts
+        if colors is self._applied_colors:
+            return
+        self._applied_colors = colors
         self.current_colors = colors
         
-        # Update background colors
-        self.root.configure(bg=colors['bg'])
-        self.main_frame.configure(bg=colors['bg'])
-        
-        # Update labels
-        self.cycle_label.configure(bg=colors['bg'], fg=colors['text'])
+        # Update themed frames, labels and buttons
+        self._configure_styles(colors)
         
-        # Update canvas
-        self.canvas.configure(bg=colors['bg'])
-        self.session_label.configure(bg=colors['bg'], fg=colors['primary'])
-        self.time_label.configure(bg=colors['bg'], fg=colors['text'])
+        # Root, canvases and the progress ring outlines in one Tcl round-trip
+        bg = colors['bg']
+        canvas_w = self.canvas._w
+        self.root.tk.eval(
+            f"{self.root._w} configure -bg {{{bg}}}\n"
+            f"{canvas_w} configure -bg {{{bg}}}\n"
+            f"{canvas_w} itemconfigure {self.progress_bg_arc} -outline {{{colors['progress_bg']}}}\n"
+            f"{canvas_w} itemconfigure {self.progress_arc} -outline {{{colors['progress']}}}\n"
+            f"{self.graph_canvas._w} configure -bg {{{bg}}}"
+        )
+    
+    def _create_notification(self):
+        """Build the hidden toast window reused by show_notification."""
+        bg = '#2C3E50'
+        self._notify = tk.Toplevel(self.root, bg=bg)
+        self._notify.withdraw()
+        self._notify.overrideredirect(True)
+        self._notify.attributes('-topmost', True)
+        self._notify_title = tk.Label(self._notify, font=self.fonts['heading'], bg=bg, fg='white')
+        self._notify_title.pack(padx=20, pady=(12, 0))
+        self._notify_label = tk.Label(self._notify, font=self.fonts['small'], bg=bg, fg='white')
+        self._notify_label.pack(padx=20, pady=(4, 12))
+        self._notify_after = None
+    
+    def show_notification(self, title: str, message: str):
+        """Show a short-lived notification toast near the top of the window."""
+        if not self._main_ready:
+            self._deferred_init_main()
+        self._notify_title.config(text=title)
+        self._notify_label.config(text=message)
         
-        # Update progress arcs
-        self.canvas.itemconfig(self.progress_bg_arc, outline=colors['progress_bg'])
-        self.canvas.itemconfig(self.progress_arc, outline=colors['progress'])
+        # Center it horizontally over the main window
+        self._notify.update_idletasks()
+        x = self.root.winfo_rootx() + (self.root.winfo_width() - self._notify.winfo_reqwidth()) // 2
+        y = self.root.winfo_rooty() + 40
+        self._notify.geometry(f"+{x}+{y}")
+        self._notify.deiconify()
         
-        # Update graph canvas
-        self.graph_canvas.configure(bg=colors['bg'])
-
-
-        """
-        def get_session_name(self) -> str:
-            #Get the current session name from entry field.
-        name = self.session_name_entry.get().strip()
-        if name == "" or name == "e.g., Study Math, Workout":
-            return "Untitled Session"
-        return name"""
+        # A new notification restarts the timeout
+        if self._notify_after:
+            self.root.after_cancel(self._notify_after)
+        self._notify_after = self.root.after(self.NOTIFY_MS, self._hide_notification)
     
-    def show_notification(self, title: str, message: str):
-        """Show a notification dialog."""
-        messagebox.showinfo(title, message)
+    def _hide_notification(self):
+        """Hide the notification toast."""
+        self._notify_after = None
+        self._notify.withdraw()
     
     def show_settings_dialog(self, current_config: Dict) -> Dict:
         """Show settings dialog and return updated config."""
-        dialog = SettingsDialog(self.root, current_config)
-        self.root.wait_window(dialog.dialog)
-        return dialog.result
+        # Build the dialog once, then just refresh and re-show it
+        if self._settings_dialog is None:
+            self._settings_dialog = SettingsDialog(self.root, current_config)
+        else:
+            self._settings_dialog.refresh(current_config)
+            self._settings_dialog.show()
+        self._settings_dialog.wait()
+        return self._settings_dialog.result
 
 
 class SettingsDialog:
     """Dialog for configuring Pomodoro settings."""
     
+    # Config key -> seconds per unit shown in the dialog (durations are edited in minutes)
+    _SCALES = {
+        'work_duration': 60,
+        'short_break_duration': 60,
+        'long_break_duration': 60,
+        'cycles_before_long_break': 1,
+    }
+    
+    # Config key -> largest value the dialog accepts (fields start at 1)
+    _MAXIMUMS = {
+        'work_duration': 60,
+        'short_break_duration': 30,
+        'long_break_duration': 60,
+        'cycles_before_long_break': 10,
+    }
+    
     def __init__(self, parent, current_config: Dict):
         """Initialize settings dialog."""
         self.result = None
@@ -649,10 +919,58 @@ class SettingsDialog:
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
+        # Closing only hides the dialog so it can be reopened cheaply
+        self.dialog.protocol("WM_DELETE_WINDOW", self.hide)
+        self._closed = tk.BooleanVar(self.dialog, value=False)
+        
         self._create_widgets()
+        for key, var in self._vars.items():
+            var.trace_add('write', lambda *_, key=key: self._parse(key))
+        self.refresh(current_config)
+    
+    def refresh(self, current_config: Dict):
+        """Reset the dialog fields from the given config."""
+        self.result = None
+        self.current_config = current_config
+        for key, scale in self._SCALES.items():
+            self._vars[key].set(str(current_config[key] // scale))
+    
+    def show(self):
+        """Show the hidden dialog again."""
+        self._closed.set(False)
+        self.dialog.deiconify()
+        self.dialog.lift()
+        self.dialog.grab_set()
+    
+    def hide(self):
+        """Hide the dialog without destroying it."""
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+        self._closed.set(True)
+    
+    def wait(self):
+        """Block (running the event loop) until the dialog is hidden."""
+        self.dialog.wait_variable(self._closed)
+    
+    def _parse(self, key: str):
+        """Re-parse one field after an edit and update the inline error."""
+        try:
+            value = int(self._vars[key].get())
+        except ValueError:
+            value = 0
+        if 1 <= value <= self._MAXIMUMS[key]:
+            self._parsed[key] = value
+        else:
+            self._parsed.pop(key, None)
+        valid = len(self._parsed) == len(self._SCALES)
+        self._error_label.config(text="" if valid else "Please enter valid numbers")
     
     def _create_widgets(self):
         """Create dialog widgets."""
+        # Field values, parsed as they are edited
+        self._vars = {key: tk.StringVar(self.dialog) for key in self._SCALES}
+        self._parsed = {}
+        
         main_frame = tk.Frame(self.dialog, padx=20, pady=20)
         main_frame.pack(fill=tk.BOTH, expand=True)
         
@@ -661,11 +979,9 @@ class SettingsDialog:
             row=0, column=0, sticky='w', pady=10
         )
         self.work_duration = tk.Spinbox(
-            main_frame, from_=1, to=60, width=10,
-            font=('Helvetica', 10)
+            main_frame, from_=1, to=self._MAXIMUMS['work_duration'], width=10,
+            font=('Helvetica', 10), textvariable=self._vars['work_duration']
         )
-        self.work_duration.delete(0, tk.END)
-        self.work_duration.insert(0, str(self.current_config['work_duration'] // 60))
         self.work_duration.grid(row=0, column=1, pady=10)
         
         # Short break duration
@@ -673,11 +989,9 @@ class SettingsDialog:
             row=1, column=0, sticky='w', pady=10
         )
         self.short_break = tk.Spinbox(
-            main_frame, from_=1, to=30, width=10,
-            font=('Helvetica', 10)
+            main_frame, from_=1, to=self._MAXIMUMS['short_break_duration'], width=10,
+            font=('Helvetica', 10), textvariable=self._vars['short_break_duration']
         )
-        self.short_break.delete(0, tk.END)
-        self.short_break.insert(0, str(self.current_config['short_break_duration'] // 60))
         self.short_break.grid(row=1, column=1, pady=10)
         
         # Long break duration
@@ -685,11 +999,9 @@ class SettingsDialog:
             row=2, column=0, sticky='w', pady=10
         )
         self.long_break = tk.Spinbox(
-            main_frame, from_=1, to=60, width=10,
-            font=('Helvetica', 10)
+            main_frame, from_=1, to=self._MAXIMUMS['long_break_duration'], width=10,
+            font=('Helvetica', 10), textvariable=self._vars['long_break_duration']
         )
-        self.long_break.delete(0, tk.END)
-        self.long_break.insert(0, str(self.current_config['long_break_duration'] // 60))
         self.long_break.grid(row=2, column=1, pady=10)
         
         # Cycles before long break
@@ -697,16 +1009,18 @@ class SettingsDialog:
             row=3, column=0, sticky='w', pady=10
         )
         self.cycles = tk.Spinbox(
-            main_frame, from_=1, to=10, width=10,
-            font=('Helvetica', 10)
+            main_frame, from_=1, to=self._MAXIMUMS['cycles_before_long_break'], width=10,
+            font=('Helvetica', 10), textvariable=self._vars['cycles_before_long_break']
         )
-        self.cycles.delete(0, tk.END)
-        self.cycles.insert(0, str(self.current_config['cycles_before_long_break']))
         self.cycles.grid(row=3, column=1, pady=10)
         
+        # Inline validation message
+        self._error_label = tk.Label(main_frame, font=('Helvetica', 10), fg='#E74C3C')
+        self._error_label.grid(row=4, column=0, columnspan=2)
+        
         # Buttons
         button_frame = tk.Frame(main_frame)
-        button_frame.grid(row=4, column=0, columnspan=2, pady=20)
+        button_frame.grid(row=5, column=0, columnspan=2, pady=20)
         
         tk.Button(
             button_frame, text="Save", command=self._save,
@@ -715,20 +1029,15 @@ class SettingsDialog:
         ).pack(side=tk.LEFT, padx=5)
         
         tk.Button(
-            button_frame, text="Cancel", command=self.dialog.destroy,
+            button_frame, text="Cancel", command=self.hide,
             font=('Helvetica', 10), padx=20, pady=5,
             relief=tk.FLAT, cursor='hand2'
         ).pack(side=tk.LEFT, padx=5)
     
     def _save(self):
         """Save settings and close dialog."""
-        try:
-            self.result = {
-                'work_duration': int(self.work_duration.get()) * 60,
-                'short_break_duration': int(self.short_break.get()) * 60,
-                'long_break_duration': int(self.long_break.get()) * 60,
-                'cycles_before_long_break': int(self.cycles.get()),
-            }
-            self.dialog.destroy()
-        except ValueError:
-            messagebox.showerror("Error", "Please enter valid numbers")
+        # Fields are parsed as they change; an invalid one is already flagged inline
+        if len(self._parsed) != len(self._SCALES):
+            return
+        self.result = {key: value * self._SCALES[key] for key, value in self._parsed.items()}
+        self.hide()